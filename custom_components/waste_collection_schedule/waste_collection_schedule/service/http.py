@@ -0,0 +1,39 @@
+# Process-wide requests.Session shared by sources.
+#
+# Home Assistant instances typically configure several sources which all poll
+# on the same schedule. Fetching through one pooled session lets connections
+# to the same backend/CDN be reused across polls and across sources instead
+# of paying a TCP+TLS handshake per request. Sources should prefer
+# shared_session() over creating their own Session; per-request headers can
+# still be passed to get()/post() as usual.
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSION: requests.Session | None = None
+
+
+def shared_session() -> requests.Session:
+    """Return the process-wide session with keep-alive and retry."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_maxsize=20,
+            # Retry with backoff at the adapter level; 403 covers the
+            # intermittent bot protection some council sites use.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[403, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                # Hand the final response back to the caller's status checks
+                # instead of raising RetryError after exhaustion.
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
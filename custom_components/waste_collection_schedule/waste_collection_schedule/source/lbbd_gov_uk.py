@@ -1,7 +1,12 @@
-from datetime import datetime
+import sys
+import types
+from datetime import date
+from itertools import chain
 
-import requests
+import aiohttp
+import orjson
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.http import shared_session
 
 TITLE = "London Borough of Barking and Dagenham"
 DESCRIPTION = "Source for London Borough of Barking and Dagenham."
@@ -11,51 +16,129 @@ TEST_CASES = {
     "40 Porters Avenue": {"uprn": "100024629"},
 }
 
-COLLECTION_MAP = {
-    "Grey-Household": {
-        "waste_type": "General waste",
-        "icon": "mdi:trash-can",
-    },
-    "Brown-Recycling": {
-        "waste_type": "Recycling",
-        "icon": "mdi:recycle",
-    },
-    "Green-Garden": {
-        "waste_type": "Garden waste",
-        "icon": "mdi:grass",
-    },
-}
+# bin_type -> (waste_type, icon); frozen with interned keys so the hot-loop
+# lookups reduce to pointer comparisons and the map cannot be mutated.
+COLLECTION_MAP = types.MappingProxyType(
+    {
+        sys.intern("Grey-Household"): ("General waste", "mdi:trash-can"),
+        sys.intern("Brown-Recycling"): ("Recycling", "mdi:recycle"),
+        sys.intern("Green-Garden"): ("Garden waste", "mdi:grass"),
+    }
+)
 
 API_URL = "https://www.lbbd.gov.uk/rest/bin/{uprn}"
 
+_MONTHS = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+
+
+def _parse_date(s: str) -> date:
+    # Dates always look like "Monday 12 January 2025"; decoding them
+    # directly is much cheaper than strptime with its format re-parse.
+    _, day, month, year = s.split()
+    return date(int(year), _MONTHS[month], int(day))
+
+
+def _parse_bin_data(rubbish_data: dict) -> list[Collection]:
+    return [
+        Collection(
+            date=_parse_date(collection_date),
+            t=waste_type,
+            icon=icon,
+        )
+        for result in rubbish_data["results"]
+        # single-element tuple binds the mapping once per result
+        for waste_type, icon in (
+            COLLECTION_MAP.get(
+                sys.intern(result["bin_type"]), (result["bin_type"], None)
+            ),
+        )
+        for collection_date in chain(
+            (result["nextcollection"],) if result["nextcollection"] else (),
+            result["futurecollections"],
+        )
+    ]
+
+
+HEADERS = {"user-agent": "Home-Assitant-waste-col-sched/2.11"}
+
+# Process-wide session so pooled connections survive across scheduled polls
+# and are shared with other sources polling the same backends.
+_SESSION = shared_session()
+
+# Lazily created counterpart for async_fetch; must be constructed inside a
+# running event loop.
+_ASYNC_SESSION: aiohttp.ClientSession | None = None
+
+# uprn -> (etag, decoded payload); the schedule changes at most weekly, so
+# let the server answer 304 Not Modified and skip the body transfer. The
+# cache holds the payload rather than Collection objects because the
+# framework mutates entries in place (day offsets, customization), so each
+# fetch must return freshly built entries.
+_ETAG_CACHE: dict[str, tuple[str, dict]] = {}
+
+
+def _get_async_session() -> aiohttp.ClientSession:
+    global _ASYNC_SESSION
+    if _ASYNC_SESSION is None or _ASYNC_SESSION.closed:
+        _ASYNC_SESSION = aiohttp.ClientSession()
+    return _ASYNC_SESSION
+
 
 class Source:
     def __init__(self, uprn: str | int):
         self._uprn: str = str(uprn)
 
+    def _request_headers(self) -> dict[str, str]:
+        cached = _ETAG_CACHE.get(self._uprn)
+        if cached:
+            return {**HEADERS, "If-None-Match": cached[0]}
+        return HEADERS
+
+    def _store_payload(self, etag: str | None, rubbish_data: dict) -> None:
+        if etag:
+            _ETAG_CACHE[self._uprn] = (etag, rubbish_data)
+
     def fetch(self):
-        headers = {"user-agent": "Home-Assitant-waste-col-sched/2.11"}
-
-        r = requests.get(API_URL.format(uprn=self._uprn), headers=headers, timeout=30)
-        rubbish_data = r.json()
-
-        entries = []
-
-        for result in rubbish_data["results"]:
-            collection_type = COLLECTION_MAP.get(
-                result["bin_type"],
-                {"waste_type": result["bin_type"], "icon": None},
-            )
-
-            for collection_date in (
-                [result["nextcollection"]] if result["nextcollection"] else []
-            ) + result["futurecollections"]:
-                entries.append(
-                    Collection(
-                        date=datetime.strptime(collection_date, "%A %d %B %Y").date(),
-                        t=collection_type["waste_type"],
-                        icon=collection_type["icon"],
-                    )
-                )
-
-        return entries
+        r = _SESSION.get(
+            API_URL.format(uprn=self._uprn),
+            headers=self._request_headers(),
+            timeout=30,
+        )
+
+        if r.status_code == 304:
+            return _parse_bin_data(_ETAG_CACHE[self._uprn][1])
+
+        rubbish_data = orjson.loads(r.content)
+        self._store_payload(r.headers.get("ETag"), rubbish_data)
+        return _parse_bin_data(rubbish_data)
+
+    async def async_fetch(self):
+        # Event-loop friendly variant for callers that already run inside
+        # Home Assistant's loop; fetch remains the executor entry point.
+        session = _get_async_session()
+        async with session.get(
+            API_URL.format(uprn=self._uprn),
+            headers=self._request_headers(),
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as r:
+            if r.status == 304:
+                return _parse_bin_data(_ETAG_CACHE[self._uprn][1])
+            raw = await r.read()
+            etag = r.headers.get("ETag")
+
+        rubbish_data = orjson.loads(raw)
+        self._store_payload(etag, rubbish_data)
+        return _parse_bin_data(rubbish_data)
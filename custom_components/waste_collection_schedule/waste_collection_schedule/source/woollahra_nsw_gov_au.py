@@ -1,12 +1,18 @@
 import datetime
-import json
+import html
+import re
+import sys
 import time
+import types
+from urllib.parse import quote
 
+import aiohttp
 import dateutil.parser
+import orjson
 import requests
-from bs4 import BeautifulSoup
-from requests.utils import requote_uri
+from bs4 import BeautifulSoup, SoupStrainer
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.http import shared_session
 
 TITLE = "Woollahra Municipal Council (NSW)"
 DESCRIPTION = "Source for Woollahra Municipal Council rubbish collection."
@@ -41,123 +47,269 @@ HEADERS = {
     "Priority": "u=0, i",
 }
 
+# Header overrides for the JSON API calls
+API_HEADERS = {
+    **HEADERS,
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+    "Referer": "https://www.woollahra.nsw.gov.au/Services/Rubbish-and-recycling/Find-your-rubbish-and-scheduled-clean-up-service-dates",
+    "X-Requested-With": "XMLHttpRequest",
+    "Sec-Fetch-Dest": "empty",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+}
+
+# Process-wide session so cookies and pooled connections survive across
+# scheduled polls and are shared with other sources; its adapter retries
+# with backoff on 403 (bot protection) and transient 5xx responses.
+_SESSION = shared_session()
+
+# Lazily created counterpart for async_fetch; must be constructed inside a
+# running event loop.
+_ASYNC_SESSION: aiohttp.ClientSession | None = None
+
+
+def _get_async_session() -> aiohttp.ClientSession:
+    global _ASYNC_SESSION
+    if _ASYNC_SESSION is None or _ASYNC_SESSION.closed:
+        _ASYNC_SESSION = aiohttp.ClientSession(headers=HEADERS)
+    return _ASYNC_SESSION
+
+
+# The configured address never changes for an entity, so resolve it to a
+# location id once and reuse the result on every subsequent poll.
+_LOCATION_CACHE: dict[str, str] = {}
+
 # Constants
 CLEANUP_ICON = "mdi:delete-sweep"
 DATE_FORMAT_LONG = "%d %B %Y"
 
-ICON_MAP = {
-    "General Waste": "mdi:trash-can",
-    "Green Waste": "mdi:leaf",
-    "Recycling": "mdi:recycle",
-    "Spring Clean-Up": CLEANUP_ICON,
-    "Summer Clean-Up": CLEANUP_ICON,
-    "Winter Clean-Up": CLEANUP_ICON,
+# Fast path for the usual "12 March 2025" dates embedded in the service
+# text; dateutil's fuzzy parser stays as fallback for anything else.
+_DATE_RE = re.compile(r"(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})")
+
+# Normalizes seasonal cleanup headings like "SPRING CLEAN UP" in one pass.
+_CLEANUP_RE = re.compile(r"(spring|summer|winter).*clean", re.IGNORECASE)
+
+# Only the service result blocks are of interest, so skip building a tree
+# for the rest of the HTML fragment.
+_SERVICES_STRAINER = SoupStrainer(
+    "div", attrs={"class": re.compile(r"\bwaste-services-result\b")}
+)
+
+# The fragment only yields two fields per service block, so pull them out
+# directly instead of building a tree; BeautifulSoup stays as fallback in
+# case the markup changes.
+# Applied per result block (the fragment is split on the block marker
+# first), so a block without a scheduled date cannot pair its heading with
+# a neighbour's date.
+_SERVICE_RE = re.compile(
+    r"<h3[^>]*>(.*?)</h3>.*?next-service[^>]*>(.*?)</div>",
+    re.S,
+)
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+_MONTHS = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
 }
 
+# Frozen with interned keys so the per-entry lookups reduce to pointer
+# comparisons and the map cannot be mutated.
+ICON_MAP = types.MappingProxyType(
+    {
+        sys.intern("General Waste"): "mdi:trash-can",
+        sys.intern("Green Waste"): "mdi:leaf",
+        sys.intern("Recycling"): "mdi:recycle",
+        sys.intern("Spring Clean-Up"): CLEANUP_ICON,
+        sys.intern("Summer Clean-Up"): CLEANUP_ICON,
+        sys.intern("Winter Clean-Up"): CLEANUP_ICON,
+    }
+)
+
+
+def _parse_date(date_text: str) -> datetime.date | None:
+    """Parse various date formats found in the response."""
+    # Texts without a digit (empty, "N/A", ...) can never parse; bail out
+    # before paying for the fuzzy parser's exception path.
+    if not date_text or len(date_text) < 6 or not any(c.isdigit() for c in date_text):
+        return None
+
+    m = _DATE_RE.search(date_text)
+    if m:
+        day, month, year = m.groups()
+        month_number = _MONTHS.get(month.capitalize())
+        if month_number:
+            try:
+                return datetime.date(int(year), month_number, int(day))
+            except ValueError:
+                # Out-of-range day ("30 February"); let dateutil decide
+                pass
+
+    try:
+        return dateutil.parser.parse(date_text, dayfirst=True, fuzzy=True).date()
+    except (dateutil.parser.ParserError, OverflowError):
+        return None
+
+
+def _extract_location_id(data: dict, address: str) -> str:
+    """Pick the location id out of an address-search response."""
+    location_id = None
+    if data.get("Items") and len(data["Items"]) > 0:
+        location_id = data["Items"][0]["Id"]
+
+    if not location_id:
+        raise ValueError(
+            f"Unable to find location ID for {address}. Please check your address details are correct."
+        )
 
-class Source:
-    def __init__(self, address: str):
-        self.address = address.strip()
+    return location_id
 
-    def _make_request_with_retry(
-        self, session, url, headers, max_retries=3, timeout=30
-    ):
-        """Make HTTP request with retry logic and exponential backoff."""
-        for attempt in range(max_retries):
-            try:
-                r = session.get(url, headers=headers, timeout=timeout)
 
-                if r.status_code == 200:
-                    return r
-                elif r.status_code == 403 and attempt < max_retries - 1:
-                    time.sleep(2**attempt)  # Exponential backoff
-                    continue
-                else:
-                    raise Exception(
-                        f"Failed to fetch: {r.status_code} (attempt {attempt + 1})"
-                    )
+def _build_entry(waste_type: str, date_text: str) -> Collection | None:
+    """Build a collection entry from the extracted waste type and date text."""
+    # Normalize seasonal cleanup names
+    cleanup_match = _CLEANUP_RE.search(waste_type)
+    if cleanup_match:
+        waste_type = f"{cleanup_match.group(1).capitalize()} Clean-Up"
 
-            except requests.RequestException as e:
-                if attempt == max_retries - 1:
-                    raise Exception(f"Network error: {str(e)}")
-                time.sleep(2**attempt)
+    # Parse different date formats
+    date = _parse_date(date_text)
+    if not date:
+        return None
 
-        raise requests.exceptions.RequestException(
-            "Max retries exceeded while fetching URL"
-        )
+    return Collection(
+        date=date,
+        t=waste_type,
+        icon=ICON_MAP.get(sys.intern(waste_type), "mdi:trash-can"),
+    )
 
-    def fetch(self):
-        location_id = None
 
+def _parse_services(response_content: str) -> list[Collection]:
+    """Turn the waste-services HTML fragment into collection entries."""
+    entries = []
+
+    # Split on the block marker so each match is confined to one block; a
+    # block with a heading but no scheduled date is skipped, like the soup
+    # path's missing-element guards.
+    for block in response_content.split("waste-services-result")[1:]:
+        m = _SERVICE_RE.search(block)
+        if not m:
+            continue
+
+        # Collapse the whitespace left by tag stripping so nested markup
+        # yields the same text as the soup path
+        waste_type = " ".join(html.unescape(_TAG_RE.sub(" ", m.group(1))).split())
+        date_text = " ".join(html.unescape(_TAG_RE.sub(" ", m.group(2))).split())
+
+        entry = _build_entry(waste_type, date_text)
+        if entry:
+            entries.append(entry)
+
+    # If the regex found nothing although result blocks are present, the
+    # markup probably changed - fall back to the tree parser.
+    if not entries and "waste-services-result" in response_content:
+        entries = _parse_services_soup(response_content)
+
+    return entries
+
+
+def _parse_services_soup(response_content: str) -> list[Collection]:
+    soup = BeautifulSoup(response_content, "lxml", parse_only=_SERVICES_STRAINER)
+    services = soup.find_all("div", attrs={"class": "waste-services-result"})
+
+    entries = []
+
+    for item in services:
+        # Extract the waste type from h3 tag
+        waste_type_element = item.find("h3")
+        if not waste_type_element:
+            continue
+
+        # Find the date information
+        date_element = item.find("div", attrs={"class": "next-service"})
+        if not date_element:
+            continue
+
+        entry = _build_entry(waste_type_element.text.strip(), date_element.text.strip())
+        if entry:
+            entries.append(entry)
+
+    return entries
+
+
+class Source:
+    # Tracks whether the shared session has visited the main page yet; the
+    # warm-up cookies persist in _SESSION, so one visit is enough.
+    _warmed = False
+
+    def __init__(self, address: str):
+        self.address = address.strip()
+
+    def fetch(self):
         address = self.address
 
-        # Create a session to maintain cookies and state
-        session = requests.Session()
-        session.headers.update(HEADERS)
+        session = _SESSION
 
-        # First, visit the main page to establish a session and get cookies
-        try:
-            main_page_response = session.get(
-                "https://www.woollahra.nsw.gov.au/Services/Rubbish-and-recycling/Find-your-rubbish-and-scheduled-clean-up-service-dates",
-                timeout=30,
-            )
-            if main_page_response.status_code not in [200, 403]:
-                time.sleep(2)  # Wait a bit if we get an unexpected response
-        except requests.RequestException:
-            # If we can't access the main page, we might still be able to access the API
-            pass
-
-        # Update headers for the API calls
-        api_headers = HEADERS.copy()
-        api_headers.update(
-            {
-                "Accept": "application/json, text/javascript, */*; q=0.01",
-                "Referer": "https://www.woollahra.nsw.gov.au/Services/Rubbish-and-recycling/Find-your-rubbish-and-scheduled-clean-up-service-dates",
-                "X-Requested-With": "XMLHttpRequest",
-                "Sec-Fetch-Dest": "empty",
-                "Sec-Fetch-Mode": "cors",
-                "Sec-Fetch-Site": "same-origin",
-            }
-        )
+        # Visit the main page once to establish a session and get cookies
+        if not Source._warmed:
+            try:
+                main_page_response = session.get(
+                    "https://www.woollahra.nsw.gov.au/Services/Rubbish-and-recycling/Find-your-rubbish-and-scheduled-clean-up-service-dates",
+                    headers=HEADERS,
+                    timeout=30,
+                )
+                if main_page_response.status_code not in [200, 403]:
+                    time.sleep(2)  # Wait a bit if we get an unexpected response
+            except requests.RequestException:
+                # If we can't access the main page, we might still be able to access the API
+                pass
+            Source._warmed = True
 
-        q = requote_uri(str(API_URLS["address_search"]).format(address))
+        location_id = _LOCATION_CACHE.get(address)
 
-        # Retrieve address search results with retry logic
-        r = self._make_request_with_retry(session, q, api_headers)
+        if location_id is None:
+            q = API_URLS["address_search"].format(quote(address, safe=""))
 
-        # Handle potential bot protection response
-        if r.status_code != 200:
-            raise Exception(
-                f"Unable to access Woollahra API (status: {r.status_code}). This may be due to bot protection. Please try again later or contact support."
-            )
+            # Retrieve address search results; the adapter retries with
+            # backoff on transient errors
+            r = session.get(q, headers=API_HEADERS, timeout=30)
 
-        try:
-            data = json.loads(r.text)
-        except json.JSONDecodeError:
-            # Check if we got an HTML error page instead of JSON
-            if "Access Denied" in r.text:
+            # Handle potential bot protection response
+            if r.status_code != 200:
                 raise Exception(
-                    "Access denied by Woollahra website. This may be due to bot protection measures. Please try again later."
+                    f"Unable to access Woollahra API (status: {r.status_code}). This may be due to bot protection. Please try again later or contact support."
                 )
-            else:
-                raise Exception("Invalid JSON response from address search API")
-
-        # Find the ID for our address
-        if data.get("Items") and len(data["Items"]) > 0:
-            location_id = data["Items"][0]["Id"]
 
-        if not location_id:
-            raise ValueError(
-                f"Unable to find location ID for {address}. Please check your address details are correct."
-            )
+            try:
+                data = orjson.loads(r.content)
+            except orjson.JSONDecodeError:
+                # Check if we got an HTML error page instead of JSON; compare
+                # on the raw bytes so r.text is never materialized
+                if b"Access Denied" in r.content:
+                    raise Exception(
+                        "Access denied by Woollahra website. This may be due to bot protection measures. Please try again later."
+                    )
+                else:
+                    raise Exception("Invalid JSON response from address search API")
 
-        time.sleep(1)  # Brief delay between requests
+            location_id = _extract_location_id(data, address)
+            _LOCATION_CACHE[address] = location_id
 
         # Retrieve the upcoming collections for our property
-        q = requote_uri(str(API_URLS["collection"]).format(location_id))
+        q = API_URLS["collection"].format(quote(str(location_id), safe=""))
 
-        # Retry logic for waste services API
-        r = self._make_request_with_retry(session, q, api_headers)
+        r = session.get(q, headers=API_HEADERS, timeout=30)
 
         if r.status_code != 200:
             raise Exception(
@@ -165,9 +317,9 @@ class Source:
             )
 
         try:
-            data = json.loads(r.text)
-        except json.JSONDecodeError:
-            if "Access Denied" in r.text:
+            data = orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            if b"Access Denied" in r.content:
                 raise Exception(
                     "Access denied by Woollahra website during waste services fetch."
                 )
@@ -177,53 +329,51 @@ class Source:
         if not data.get("success") or not data.get("responseContent"):
             raise RuntimeError("Invalid response from waste services API")
 
-        response_content = data["responseContent"]
+        return _parse_services(data["responseContent"])
 
-        soup = BeautifulSoup(response_content, "html.parser")
-        services = soup.find_all("div", attrs={"class": "waste-services-result"})
+    async def async_fetch(self):
+        # Event-loop friendly variant for callers that already run inside
+        # Home Assistant's loop; fetch remains the executor entry point.
+        address = self.address
 
-        entries = []
+        session = _get_async_session()
+        timeout = aiohttp.ClientTimeout(total=30)
 
-        for item in services:
-            # Extract the waste type from h3 tag
-            waste_type_element = item.find("h3")
-            if not waste_type_element:
-                continue
+        location_id = _LOCATION_CACHE.get(address)
 
-            waste_type = waste_type_element.text.strip()
+        if location_id is None:
+            q = API_URLS["address_search"].format(quote(address, safe=""))
 
-            # Normalize seasonal cleanup names
-            if "spring" in waste_type.lower() and "clean" in waste_type.lower():
-                waste_type = "Spring Clean-Up"
-            elif "summer" in waste_type.lower() and "clean" in waste_type.lower():
-                waste_type = "Summer Clean-Up"
-            elif "winter" in waste_type.lower() and "clean" in waste_type.lower():
-                waste_type = "Winter Clean-Up"
+            async with session.get(q, headers=API_HEADERS, timeout=timeout) as r:
+                if r.status != 200:
+                    raise Exception(
+                        f"Unable to access Woollahra API (status: {r.status}). This may be due to bot protection. Please try again later or contact support."
+                    )
+                raw = await r.read()
 
-            # Find the date information
-            date_element = item.find("div", attrs={"class": "next-service"})
-            if not date_element:
-                continue
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                raise Exception("Invalid JSON response from address search API")
 
-            date_text = date_element.text.strip()
+            location_id = _extract_location_id(data, address)
+            _LOCATION_CACHE[address] = location_id
 
-            # Parse different date formats
-            date = self._parse_date(date_text)
+        q = API_URLS["collection"].format(quote(str(location_id), safe=""))
 
-            if date:
-                entries.append(
-                    Collection(
-                        date=date,
-                        t=waste_type,
-                        icon=ICON_MAP.get(waste_type, "mdi:trash-can"),
-                    )
+        async with session.get(q, headers=API_HEADERS, timeout=timeout) as r:
+            if r.status != 200:
+                raise Exception(
+                    f"Unable to access Woollahra waste services API (status: {r.status})"
                 )
+            raw = await r.read()
 
-        return entries
-
-    def _parse_date(self, date_text: str) -> datetime.date | None:
-        """Parse various date formats found in the response."""
         try:
-            return dateutil.parser.parse(date_text, dayfirst=True, fuzzy=True).date()
-        except (dateutil.parser.ParserError, OverflowError):
-            return None
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            raise Exception("Invalid JSON response from waste services API")
+
+        if not data.get("success") or not data.get("responseContent"):
+            raise RuntimeError("Invalid response from waste services API")
+
+        return _parse_services(data["responseContent"])
@@ -0,0 +1,91 @@
+"""
+Tests for the London Borough of Barking and Dagenham source's parsing helpers.
+
+Note: This test file is not auto-discovered by pytest due to pytest.ini configuration.
+To run this test specifically:
+    pytest tests/test_lbbd_gov_uk.py
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "custom_components",
+        "waste_collection_schedule",
+    )
+)
+
+from waste_collection_schedule.source import lbbd_gov_uk  # noqa: E402
+
+
+def test_parse_date():
+    assert lbbd_gov_uk._parse_date("Monday 12 January 2025") == date(2025, 1, 12)
+    assert lbbd_gov_uk._parse_date("Friday 3 October 2025") == date(2025, 10, 3)
+
+
+def test_parse_bin_data_known_bin_type():
+    data = {
+        "results": [
+            {
+                "bin_type": "Grey-Household",
+                "nextcollection": "Monday 12 January 2025",
+                "futurecollections": ["Monday 19 January 2025"],
+            }
+        ]
+    }
+
+    entries = lbbd_gov_uk._parse_bin_data(data)
+
+    assert [(e.type, e.date, e.icon) for e in entries] == [
+        ("General waste", date(2025, 1, 12), "mdi:trash-can"),
+        ("General waste", date(2025, 1, 19), "mdi:trash-can"),
+    ]
+
+
+def test_parse_bin_data_unknown_bin_type():
+    data = {
+        "results": [
+            {
+                "bin_type": "Blue-Mystery",
+                "nextcollection": "Tuesday 4 February 2025",
+                "futurecollections": [],
+            }
+        ]
+    }
+
+    entries = lbbd_gov_uk._parse_bin_data(data)
+
+    assert [(e.type, e.date, e.icon) for e in entries] == [
+        ("Blue-Mystery", date(2025, 2, 4), None)
+    ]
+
+
+def test_parse_bin_data_empty_nextcollection():
+    data = {
+        "results": [
+            {
+                "bin_type": "Brown-Recycling",
+                "nextcollection": None,
+                "futurecollections": ["Monday 19 January 2025"],
+            },
+            {
+                "bin_type": "Green-Garden",
+                "nextcollection": "",
+                "futurecollections": [],
+            },
+        ]
+    }
+
+    entries = lbbd_gov_uk._parse_bin_data(data)
+
+    assert [(e.type, e.date) for e in entries] == [
+        ("Recycling", date(2025, 1, 19)),
+    ]
+
+
+def test_parse_bin_data_no_results():
+    assert lbbd_gov_uk._parse_bin_data({"results": []}) == []
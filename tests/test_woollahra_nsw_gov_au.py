@@ -0,0 +1,147 @@
+"""
+Tests for the Woollahra Municipal Council source's parsing helpers.
+
+Note: This test file is not auto-discovered by pytest due to pytest.ini configuration.
+To run this test specifically:
+    pytest tests/test_woollahra_nsw_gov_au.py
+"""
+
+import os
+import sys
+from datetime import date
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__),
+        "..",
+        "custom_components",
+        "waste_collection_schedule",
+    )
+)
+
+from waste_collection_schedule.source import woollahra_nsw_gov_au  # noqa: E402
+
+
+def _service_block(heading, date_text, extra_classes=""):
+    return (
+        f'<div class="waste-services-result{extra_classes}">'
+        f"<h3>{heading}</h3>"
+        f'<div class="next-service">{date_text}</div>'
+        f"</div>"
+    )
+
+
+def test_parse_date_plain():
+    assert woollahra_nsw_gov_au._parse_date("5 March 2025") == date(2025, 3, 5)
+
+
+def test_parse_date_embedded_text():
+    assert woollahra_nsw_gov_au._parse_date("Next service: 12 April 2025") == date(
+        2025, 4, 12
+    )
+
+
+def test_parse_date_out_of_range_returns_none():
+    # must not raise; the baseline fuzzy parser returned None here
+    assert woollahra_nsw_gov_au._parse_date("30 February 2025") is None
+
+
+def test_parse_date_unparseable_returns_none():
+    assert woollahra_nsw_gov_au._parse_date("") is None
+    assert woollahra_nsw_gov_au._parse_date("N/A") is None
+    assert woollahra_nsw_gov_au._parse_date("no digits here") is None
+
+
+def test_parse_date_fallback_format():
+    # no "12 March 2025" pattern, so this exercises the dateutil fallback
+    assert woollahra_nsw_gov_au._parse_date("Tue 12/3/2025") == date(2025, 3, 12)
+
+
+def test_parse_services_full_blocks():
+    content = _service_block(
+        "General Waste", "<span>5 March 2025</span>", " regular-service"
+    ) + _service_block("Recycling", "12 March 2025")
+
+    entries = woollahra_nsw_gov_au._parse_services(content)
+
+    assert [(e.type, e.date, e.icon) for e in entries] == [
+        ("General Waste", date(2025, 3, 5), "mdi:trash-can"),
+        ("Recycling", date(2025, 3, 12), "mdi:recycle"),
+    ]
+
+
+def test_parse_services_cleanup_normalization():
+    content = _service_block("SPRING clean up", "12 April 2025")
+
+    entries = woollahra_nsw_gov_au._parse_services(content)
+
+    assert len(entries) == 1
+    assert entries[0].type == "Spring Clean-Up"
+    assert entries[0].icon == woollahra_nsw_gov_au.CLEANUP_ICON
+
+
+def test_parse_services_unknown_type_gets_default_icon():
+    content = _service_block("Hazardous Waste", "1 May 2025")
+
+    entries = woollahra_nsw_gov_au._parse_services(content)
+
+    assert entries[0].icon == "mdi:trash-can"
+
+
+def test_parse_services_block_without_date_is_skipped():
+    # the first block has no next-service div; it must not borrow the
+    # date from the following block
+    content = (
+        '<div class="waste-services-result"><h3>General Waste</h3>'
+        '<div class="note">none scheduled</div></div>'
+    ) + _service_block("Green Waste", "12 March 2025")
+
+    entries = woollahra_nsw_gov_au._parse_services(content)
+
+    assert [(e.type, e.date) for e in entries] == [("Green Waste", date(2025, 3, 12))]
+
+
+def test_parse_services_block_without_heading_is_skipped():
+    content = (
+        '<div class="waste-services-result">'
+        '<div class="next-service">1 May 2025</div></div>'
+    ) + _service_block("Recycling", "2 May 2025")
+
+    entries = woollahra_nsw_gov_au._parse_services(content)
+
+    assert [(e.type, e.date) for e in entries] == [("Recycling", date(2025, 5, 2))]
+
+
+def test_parse_services_nested_tag_heading():
+    # tags inside the heading must not leave doubled whitespace, which
+    # would change the waste type and break the ICON_MAP lookup
+    content = _service_block("<span>Green</span> Waste", "12 March 2025")
+
+    entries = woollahra_nsw_gov_au._parse_services(content)
+
+    assert [(e.type, e.icon) for e in entries] == [("Green Waste", "mdi:leaf")]
+
+
+def test_parse_services_nested_tag_heading_matches_soup_fallback():
+    content = _service_block("<span>Green</span> Waste", "<span>12 March 2025</span>")
+
+    regex_entries = woollahra_nsw_gov_au._parse_services(content)
+    soup_entries = woollahra_nsw_gov_au._parse_services_soup(content)
+
+    assert [(e.type, e.date, e.icon) for e in regex_entries] == [
+        (e.type, e.date, e.icon) for e in soup_entries
+    ]
+    assert regex_entries[0].type == "Green Waste"
+
+
+def test_parse_services_matches_soup_fallback():
+    content = _service_block(
+        "General Waste", "<span>5 March 2025</span>", " regular-service"
+    ) + _service_block("winter CLEAN up", "12 July 2025")
+
+    regex_entries = woollahra_nsw_gov_au._parse_services(content)
+    soup_entries = woollahra_nsw_gov_au._parse_services_soup(content)
+
+    assert [(e.type, e.date, e.icon) for e in regex_entries] == [
+        (e.type, e.date, e.icon) for e in soup_entries
+    ]